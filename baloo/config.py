@@ -10,3 +10,5 @@ LIBS_DIR = ROOT_DIR + '/weld/libs'
 # TODO: If adding support for Windows/MAC, should check here file extension (check history of bindings.py)
 WELD_PATH = os.path.join(LIBS_DIR, 'libweld.dylib')
 ENCODERS_PATH = os.path.join(LIBS_DIR, 'numpy_weld_convertor.dylib')
+# Where the compiled Weld programs are persisted to; overridden by the BALOO_MODULE_CACHE_DIR environment variable
+MODULE_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'baloo', 'weld')
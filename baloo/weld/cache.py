@@ -45,7 +45,7 @@ class Cache(object):
     2. Cache.create_fake_array_input(placeholder, index=Optional) => returns a _FakeWeldInput.
     3. WeldObject().update(_FakeWeldInput) => returns weld id for this fake input as _inpX (raw data);
         _FakeWeldInput acts as a regular input to any further WeldObjects. Through update, the
-        input internally becomes registered in WeldObject._registry as _FakeWeldInput -> _inpX
+        input internally becomes registered in WeldObject._registry as id(_FakeWeldInput) -> _inpX
     4. Cache.cache_fake_input(id, _FakeWeldInput); the _FakeWeldInput (corresponding to a _inpX) is now cached
         and can be seen by LazyResult.evaluate(). Internally, add _inpX -> _FakeWeldInput to _cache. On evaluate,
         LazyResult replaced the placeholder in the WeldObject.context with the actual data, evaluating if necessary.
@@ -215,7 +215,7 @@ class _FakeWeldInput(abc.ABC):
     def __repr__(self):
         return '_FakeWeldInput(dependency={}, name={})'.format(self.dependency, self.name)
 
-    # the str representation is added to WeldObject._registry
+    # the str representation is the readable placeholder
     def __str__(self):
         return self.name
 
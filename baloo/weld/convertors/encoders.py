@@ -1,4 +1,5 @@
 import ctypes
+import weakref
 
 import numpy as np
 
@@ -11,6 +12,8 @@ from ...config import ENCODERS_PATH
 # Python2: str is ascii -> 'Bürgermeister' does not exist; u'Bürgermeister'.encode() => 'B\xc3\xbcrgermeister'
 
 supported_dtype_chars = {'h', 'i', 'l', 'f', 'd', '?', 'S'}
+# arrays of these dtypes have the same memory layout in Weld
+_zero_copy_dtype_chars = {'h', 'i', 'l', 'f', 'd', '?'}
 
 # TODO: datetime support
 _numpy_to_weld_type_mapping = {
@@ -136,6 +139,9 @@ def default_missing_data_literal(weld_type):
 class NumPyEncoder(WeldObjectEncoder):
     def __init__(self):
         self.utils = ctypes.PyDLL(ENCODERS_PATH)
+        # (id, data pointer, shape, dtype, strides) of array -> encoded array;
+        # evicted when the array is garbage collected
+        self._encoded_cache = {}
 
     def py_to_weld_type(self, obj):
         if isinstance(obj, np.ndarray):
@@ -188,13 +194,49 @@ class NumPyEncoder(WeldObjectEncoder):
 
         return numpy_to_weld
 
+    def _numpy_to_weld_vec(self, obj):
+        # the Weld vec merely points to the data of the array, so no need to go through the convertor library
+        weld_type = self.py_to_weld_type(obj)
+        ptr = ctypes.cast(obj.ctypes.data, POINTER(weld_type.elemType.ctype_class))
+
+        return weld_type.ctype_class(ptr, obj.shape[0])
+
+    def _encode_array(self, obj):
+        if obj.ndim == 1 and obj.dtype.char in _zero_copy_dtype_chars and obj.dtype.isnative \
+                and obj.flags['C_CONTIGUOUS'] and obj.flags['ALIGNED']:
+            return self._numpy_to_weld_vec(obj)
+
+        numpy_to_weld = self._numpy_to_weld_func(obj)
+        numpy_to_weld.restype = self.py_to_weld_type(obj).ctype_class
+        numpy_to_weld.argtypes = [py_object]
+
+        return numpy_to_weld(obj)
+
+    @staticmethod
+    def _encodes_to_view(obj):
+        # the convertor library copies the data of a 2-d array it considers transposed (its check is replicated here)
+        # and measures each string upon encoding, so only encodings merely pointing into the array are cached;
+        # otherwise in-place changes to the array would not be seen by the next evaluation
+        if obj.ndim not in (1, 2) or obj.dtype.char not in _zero_copy_dtype_chars or not obj.flags['C_CONTIGUOUS']:
+            return False
+
+        return obj.ndim == 1 or obj.strides[1] != obj.shape[0] * 8
+
     def encode(self, obj):
         if isinstance(obj, np.ndarray):
-            numpy_to_weld = self._numpy_to_weld_func(obj)
-            numpy_to_weld.restype = self.py_to_weld_type(obj).ctype_class
-            numpy_to_weld.argtypes = [py_object]
-
-            return numpy_to_weld(obj)
+            if not self._encodes_to_view(obj):
+                return self._encode_array(obj)
+
+            # the same arrays are typically inputs to many evaluations, e.g. the columns of a DataFrame
+            # the dtype and strides too, since they can be reassigned in-place without changing the rest
+            key = (id(obj), obj.ctypes.data, obj.shape, obj.dtype, obj.strides)
+            encoded = self._encoded_cache.get(key)
+            if encoded is None:
+                encoded = self._encode_array(obj)
+                self._encoded_cache[key] = encoded
+                weakref.finalize(obj, self._encoded_cache.pop, key, None)
+
+            return encoded
         elif isinstance(obj, str):
             numpy_to_weld = self.utils.str_to_weld_char_arr
             numpy_to_weld.restype = WeldVec(WeldChar()).ctype_class
@@ -1,10 +1,116 @@
 from __future__ import print_function
 
+import bisect
 import ctypes
+import hashlib
+import json
+import os
+import re
+import sys
+import threading
 import time
+import weakref
+from collections import OrderedDict, deque
 
 from . import bindings as cweld
 from .types import *
+from ...config import MODULE_CACHE_DIR, WELD_PATH
+
+_weld_id_pattern = re.compile(r'\b(_inp|obj)\d+\b')
+_obj_id_pattern = re.compile(r'\bobj\d+\b')
+# Limits how deeply WeldObjects are fused into each other, to keep Weld from parsing deeply nested expressions
+_max_fusion_depth = 8
+
+
+def _canonical_weld_code(func):
+    """Re-number the input and object ids in order of appearance.
+
+    The ids are globally unique, so the same computation over fresh inputs (or on freshly created WeldObjects)
+    would otherwise never be recognized as the same program. Since the inputs appear in the function header
+    in the same order as they are passed to Weld, renaming them does not change the program.
+    """
+    ids = {}
+
+    def rename(match):
+        name = match.group(0)
+        if name not in ids:
+            ids[name] = match.group(1) + str(len(ids))
+
+        return ids[name]
+
+    return _weld_id_pattern.sub(rename, func)
+
+
+def _module_cache_dir():
+    return os.environ.get('BALOO_MODULE_CACHE_DIR', MODULE_CACHE_DIR)
+
+
+def _weld_version():
+    # the Weld library does not expose a version, so identify the build through the library file instead
+    stat = os.stat(WELD_PATH)
+
+    return "%d-%d" % (stat.st_size, int(stat.st_mtime))
+
+
+def _persisted_programs(cache_dir):
+    """Returns the paths of the programs persisted to cache_dir, most recently persisted/used first."""
+    programs = []
+    for file_name in os.listdir(cache_dir):
+        if not file_name.endswith('.json'):
+            continue
+
+        path = os.path.join(cache_dir, file_name)
+        try:
+            programs.append((os.path.getmtime(path), path))
+        except OSError:
+            # e.g. removed by another session in the meantime
+            continue
+
+    return [path for _, path in sorted(programs, reverse=True)]
+
+
+def _remove_program(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def _persist_program(func, passes, apply_experimental_transforms, limit):
+    """Store a compiled program on disk such that WeldObject.warm_module_cache can compile it in a future session.
+
+    Only the limit most recently persisted/used programs are kept.
+    """
+    text = json.dumps({'weld': _weld_version(),
+                       'code': func,
+                       'passes': passes,
+                       'apply_experimental_transforms': apply_experimental_transforms},
+                      sort_keys=True)
+    cache_dir = _module_cache_dir()
+    path = os.path.join(cache_dir, hashlib.sha256(text.encode('utf-8')).hexdigest() + '.json')
+
+    # persisting is merely an optimization for future sessions, so never fail the evaluation because of it
+    try:
+        if os.path.exists(path):
+            # mark it as used, such that it is kept and warmed before the others
+            os.utime(path)
+
+            return
+
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp_path = "%s.%d.tmp" % (path, os.getpid())
+        with open(tmp_path, 'w') as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+
+        for old_path in _persisted_programs(cache_dir)[limit:]:
+            _remove_program(old_path)
+    except OSError:
+        pass
+
+
+def _no_clock():
+    return 0.0
 
 
 class WeldObjectEncoder(object):
@@ -30,6 +136,43 @@ class WeldObjectDecoder(object):
         raise NotImplementedError
 
 
+class _Dependencies(OrderedDict):
+    """The dependencies of a WeldObject, obj_id -> WeldObject.
+
+    Since their dependencies are typically added in-place, this resets the let statements
+    of the WeldObject, and those of its users, whenever a dependency is added or removed.
+    """
+
+    def __init__(self, dependencies=(), owner=None):
+        # a weakref such that the inputs in the owner's context are freed without waiting on the gc
+        self._owner = weakref.ref(owner) if owner is not None else None
+        super(_Dependencies, self).__init__(dependencies)
+
+    def _get_owner(self):
+        return self._owner() if self._owner is not None else None
+
+    def __setitem__(self, key, value):
+        super(_Dependencies, self).__setitem__(key, value)
+        owner = self._get_owner()
+        if owner is not None:
+            value._add_user(owner)
+            owner._reset_let_cache()
+
+    def __delitem__(self, key):
+        super(_Dependencies, self).__delitem__(key)
+        owner = self._get_owner()
+        if owner is not None:
+            owner._reset_let_cache()
+
+    # copies are plain mappings, not tied to the owner
+
+    def copy(self):
+        return OrderedDict(self)
+
+    def __reduce__(self):
+        return OrderedDict, (list(self.items()),)
+
+
 class WeldObject(object):
     """Holds a Weld program to be lazily compiled and evaluated,
     along with any context required to evaluate the program.
@@ -57,36 +200,288 @@ class WeldObject(object):
     # Counter for assigning variable names
     _var_num = 0
     _obj_id = 100
+    # Maps input -> name; arrays and other objects by id, evicted when garbage collected,
+    # while values not supporting weakrefs, e.g. str or int, by (type, repr)
     _registry = {}
+    # Compiled programs, (weld_code, passes, apply_experimental_transforms) -> WeldModule, least recently used first;
+    # bounded since e.g. each distinct literal in the Weld code results in another module
+    _module_cache = OrderedDict()
+    _module_cache_size = 128
+    _module_cache_lock = threading.Lock()
+    # WeldConfs, ((key, value), ...) -> WeldConf
+    _conf_cache = {}
+    # Holds the WeldError of each thread
+    _thread_local = threading.local()
+    # ctypes Structures wrapping the arguments, (argtype, ...) -> Args
+    _args_class_cache = {}
 
     def __init__(self, encoder, decoder):
         self.encoder = encoder
         self.decoder = decoder
 
         # Weld program
-        self.weld_code = ""
-        self.dependencies = {}
+        self._weld_code = ""
+        # The let statements of this object and its dependencies; reset when either changes
+        self._let_cache = None
+        # The WeldObjects depending on this one, whose let statements include those of this object
+        self._users = None
+        # Ordered, such that the generated program is deterministic without sorting on each traversal
+        self._dependencies = _Dependencies(owner=self)
 
         # Assign a unique ID to the context
-        self.obj_id = "obj%d" % WeldObject._obj_id
+        self.obj_id = sys.intern("obj%d" % WeldObject._obj_id)
         WeldObject._obj_id += 1
 
         # Maps name -> input data
-        self.context = {}
+        self._context = {}
+        # The names in context, sorted, i.e. the order in which the inputs are passed to Weld
+        self._sorted_names = []
         # Maps name -> arg type (for arguments that don't need to be encoded)
         self.argtypes = {}
+        # Maps name -> (input data, (dtype, ndim), WeldType, ctype class, Weld type str) as last resolved by the encoder
+        self._type_cache = {}
+
+    def __getstate__(self):
+        # the users and let statements are rebuilt, such that a copy does not share them with this object
+        state = self.__dict__.copy()
+        del state['_users']
+        state['_let_cache'] = None
+        state['_dependencies'] = OrderedDict(self._dependencies)
+
+        return state
+
+    def __setstate__(self, state):
+        state = dict(state)
+        dependencies = state.pop('_dependencies')
+        self.__dict__.update(state)
+        self._users = None
+        self._dependencies = _Dependencies(dependencies, self)
 
     def __repr__(self):
         return self.weld_code + " " + str(self.context) + " " + str([obj_id for obj_id in self.dependencies])
 
+    @property
+    def weld_code(self):
+        return self._weld_code
+
+    @weld_code.setter
+    def weld_code(self, value):
+        self._weld_code = value
+        self._reset_let_cache()
+
+    def _add_user(self, user):
+        if self._users is None:
+            self._users = weakref.WeakSet()
+        self._users.add(user)
+
+    def _reset_let_cache(self):
+        # the let statements of the (transitive) users include the weld_code of this object
+        stack = [self]
+        reset = set()
+        while stack:
+            cur_obj = stack.pop()
+            if cur_obj.obj_id in reset:
+                continue
+
+            reset.add(cur_obj.obj_id)
+            cur_obj._let_cache = None
+            if cur_obj._users is not None:
+                stack.extend(cur_obj._users)
+
+    @property
+    def context(self):
+        return self._context
+
+    @context.setter
+    def context(self, value):
+        if value.keys() != self._context.keys():
+            self._sorted_names = sorted(value.keys())
+        self._context = value
+
+    def _input_names(self):
+        # in case names were added to the context directly
+        if len(self._sorted_names) != len(self._context):
+            self._sorted_names = sorted(self._context.keys())
+
+        return self._sorted_names
+
+    def _input_type(self, name):
+        """Returns the WeldType, its ctype class, and its str for the input, resolving them only once per input data.
+
+        The cache is checked against the actual data since the context can be replaced, e.g. by LazyResult,
+        as well as against its dtype and ndim (if any) since these can be reassigned in-place, e.g. on arrays.
+        """
+        value = self.context[name]
+        layout = (getattr(value, 'dtype', None), getattr(value, 'ndim', None))
+        cached = self._type_cache.get(name)
+        if cached is None or cached[0] is not value or cached[1] != layout:
+            weld_type = self.encoder.py_to_weld_type(value)
+            cached = (value, layout, weld_type, weld_type.ctype_class, str(weld_type))
+            self._type_cache[name] = cached
+
+        return cached[2:]
+
+    @property
+    def dependencies(self):
+        return self._dependencies
+
+    @dependencies.setter
+    def dependencies(self, value):
+        self._dependencies = _Dependencies(value, self)
+        self._reset_let_cache()
+
     @staticmethod
-    def generate_input_name(value_str):
-        name = "_inp%d" % WeldObject._var_num
+    def generate_input_name(key):
+        # interned since the names are looked up in the context, argtypes, etc. on each evaluation
+        name = sys.intern("_inp%d" % WeldObject._var_num)
         WeldObject._var_num += 1
-        WeldObject._registry[value_str] = name
+        WeldObject._registry[key] = name
 
         return name
 
+    @staticmethod
+    def _compile(func, passes, apply_experimental_transforms):
+        """Compile func to a WeldModule, re-using the module if an equivalent program was compiled before.
+
+        Only the WeldObject._module_cache_size most recently used modules are kept. Setting the
+        BALOO_DISABLE_MODULE_CACHE environment variable bypasses the cache such that each program
+        is compiled from scratch, e.g. to check the cache is not the culprit of a wrong result.
+        """
+        key = (_canonical_weld_code(func), passes, bool(apply_experimental_transforms))
+        use_cache = not os.environ.get('BALOO_DISABLE_MODULE_CACHE')
+
+        with WeldObject._module_cache_lock:
+            if use_cache and key in WeldObject._module_cache:
+                WeldObject._module_cache.move_to_end(key)
+
+                return WeldObject._module_cache[key]
+
+            settings = []
+            if passes != "":
+                settings.append(("weld.optimization.passes", passes))
+            if os.environ.get('BALOO_DUMP_WELD_CODE'):
+                settings.append(("weld.compile.dumpCode", "true"))
+                # not the cache dir itself, which warm_module_cache goes through
+                dump_dir = os.path.join(_module_cache_dir(), "dump")
+                os.makedirs(dump_dir, exist_ok=True)
+                settings.append(("weld.compile.dumpCodeDir", dump_dir))
+            conf = WeldObject._conf(*settings)
+            err = WeldObject._error()
+
+            module = cweld.WeldModule(key[0], conf, err)
+            if err.code() != 0:
+                WeldObject._thread_local.error = None
+                # the original ids, which match those of the user's objects
+                raise ValueError("Could not compile function {}: {}".format(
+                    func, err.message()))
+
+            if use_cache:
+                WeldObject._module_cache[key] = module
+                if len(WeldObject._module_cache) > WeldObject._module_cache_size:
+                    WeldObject._module_cache.popitem(last=False)
+                if os.environ.get('BALOO_PERSIST_MODULE_CACHE'):
+                    _persist_program(*key, limit=WeldObject._module_cache_size)
+
+        return module
+
+    @staticmethod
+    def warm_module_cache():
+        """Compile the programs persisted by previous sessions into the module cache.
+
+        Weld cannot serialize a compiled module, so when the BALOO_PERSIST_MODULE_CACHE environment variable is set,
+        the (successfully compiled) programs themselves are persisted to BALOO_MODULE_CACHE_DIR, by default
+        ~/.cache/baloo/weld. Calling this at the start of a session, e.g. in a background thread, moves the
+        compilation of the known programs out of their first evaluation.
+
+        The most recently persisted/used programs are compiled first, up to the size of the module cache.
+        Programs persisted with another build of Weld, or which are otherwise unusable, are removed.
+        Nothing is compiled if the module cache is disabled through BALOO_DISABLE_MODULE_CACHE.
+
+        Returns the number of programs compiled.
+        """
+        cache_dir = _module_cache_dir()
+        if os.environ.get('BALOO_DISABLE_MODULE_CACHE') or not os.path.isdir(cache_dir):
+            return 0
+
+        version = _weld_version()
+        compiled = 0
+        for path in _persisted_programs(cache_dir):
+            # any further modules would merely evict those compiled before
+            if compiled >= WeldObject._module_cache_size:
+                break
+
+            # like persisting, never fail because of the cache, e.g. a file with some other content
+            try:
+                with open(path) as f:
+                    entry = json.load(f)
+            except OSError:
+                continue
+            except ValueError:
+                _remove_program(path)
+                continue
+
+            try:
+                key = (entry['code'], entry['passes'], bool(entry['apply_experimental_transforms']))
+                valid = entry['weld'] == version and isinstance(key[0], str) and isinstance(key[1], str)
+            except (KeyError, TypeError, AttributeError):
+                valid = False
+
+            if not valid:
+                _remove_program(path)
+                continue
+
+            if key in WeldObject._module_cache:
+                continue
+
+            try:
+                WeldObject._compile(*key)
+            except ValueError:
+                _remove_program(path)
+                continue
+
+            compiled += 1
+
+        return compiled
+
+    @staticmethod
+    def _conf(*settings):
+        """Returns a WeldConf with the (key, value) settings, shared by all evaluations using the same settings."""
+        if settings not in WeldObject._conf_cache:
+            conf = cweld.WeldConf()
+            for key, value in settings:
+                conf.set(key, value)
+            WeldObject._conf_cache[settings] = conf
+
+        return WeldObject._conf_cache[settings]
+
+    @staticmethod
+    def _error():
+        """Returns the WeldError of the current thread.
+
+        The caller shall discard it, i.e. reset WeldObject._thread_local.error, if an error occurred such that
+        the next compilation/run does not see a stale error code.
+        """
+        err = getattr(WeldObject._thread_local, "error", None)
+        if err is None:
+            err = WeldObject._thread_local.error = cweld.WeldError()
+
+        return err
+
+    @staticmethod
+    def _args_factory(argtypes):
+        """Returns a wrapped ctypes Structure with a field for each argtype.
+
+        Since the arguments are passed to Weld by position, the fields are named by position as well,
+        such that the same class can be re-used for all inputs with the same types.
+        """
+        if argtypes not in WeldObject._args_class_cache:
+            class Args(ctypes.Structure):
+                _fields_ = [("_%d" % i, argtype) for i, argtype in enumerate(argtypes)]
+
+            WeldObject._args_class_cache[argtypes] = Args
+
+        return WeldObject._args_class_cache[argtypes]
+
     def update(self, value, tys=None, override=True):
         """Update this context.
 
@@ -97,45 +492,103 @@ class WeldObject(object):
         """
         from baloo.weld import LazyResult
         if isinstance(value, WeldObject):
-            self.context.update(value.context)
+            self._update_context(value.context)
         elif isinstance(value, LazyResult):
-            self.context.update(value.weld_expr.context)
+            self._update_context(value.weld_expr.context)
         else:
             # Ensure that the same inputs always have same names
-            value_str = str(value)
-            if value_str in WeldObject._registry:
-                name = WeldObject._registry[value_str]
+            try:
+                weakref.ref(value)
+                key = id(value)
+            except TypeError:
+                key = (type(value), repr(value))
+
+            if key in WeldObject._registry:
+                name = WeldObject._registry[key]
             else:
-                name = WeldObject.generate_input_name(value_str)
+                name = WeldObject.generate_input_name(key)
+                if not isinstance(key, tuple):
+                    weakref.finalize(value, WeldObject._registry.pop, key, None)
+            if name not in self.context:
+                bisect.insort(self._sorted_names, name)
             self.context[name] = value
             if tys is not None and not override:
                 self.argtypes[name] = tys
 
             return name
 
+    def _update_context(self, context):
+        new_names = [name for name in context if name not in self.context]
+        self.context.update(context)
+        if len(new_names) > 0:
+            self._sorted_names = sorted(self._sorted_names + new_names)
+
     def get_let_statements(self):
-        queue = [self]
+        if self._let_cache is not None:
+            return self._let_cache
+
+        # Iterative post-order DFS, so each object is emitted after all its dependencies
+        stack = deque([(self, False)])
         visited = set()
+        ordered = []
+        while stack:
+            cur_obj, expanded = stack.pop()
+            if expanded:
+                ordered.append(cur_obj)
+            elif cur_obj.obj_id not in visited:
+                visited.add(cur_obj.obj_id)
+                stack.append((cur_obj, True))
+                # shared dependencies are only pushed as long as they have not been reached yet
+                stack.extend((dependency, False) for dependency in cur_obj.dependencies.values()
+                             if dependency.obj_id not in visited)
+
+        # obj_id -> [(user, position in the user's weld_code)]
+        uses = {}
+        # obj_id -> the obj_ids referenced in its weld_code
+        references = {}
+        for cur_obj in ordered:
+            matches = list(_obj_id_pattern.finditer(cur_obj.weld_code))
+            references[cur_obj.obj_id] = [match.group(0) for match in matches]
+            for match in matches:
+                uses.setdefault(match.group(0), []).append((cur_obj, match.start()))
+
+        # obj_id -> (code, nesting depth of the fused code)
+        inlined = {}
+
+        def inline(match):
+            obj_id = match.group(0)
+
+            return inlined[obj_id][0] if obj_id in inlined else obj_id
+
+        # Fuse the objects used only once into their user instead of binding them with a let, resulting in less
+        # code for Weld/LLVM to go through. Not done if used within a lambda since it would then be re-computed
+        # on each iteration, nor if used by self since to_weld_func repeats the weld_code of self.
         let_statements = []
-        while len(queue) > 0:
-            cur_obj = queue.pop()
-            cur_obj_id = cur_obj.obj_id
-            if cur_obj_id not in visited:
-                let_statements.insert(0, "let %s = (%s);" % (cur_obj_id, cur_obj.weld_code))
-                for key in sorted(cur_obj.dependencies.keys()):
-                    queue.append(cur_obj.dependencies[key])
-                visited.add(cur_obj_id)
-        let_statements.sort()  # To ensure that let statements are in the right order in the final generated program
-        let_statements.insert(len(let_statements), self.obj_id)
-
-        return "\n".join(let_statements)
+        for cur_obj in ordered:
+            code = cur_obj.weld_code
+            depth = 0
+            inlined_ids = [obj_id for obj_id in references[cur_obj.obj_id] if obj_id in inlined]
+            if len(inlined_ids) > 0:
+                code = _obj_id_pattern.sub(inline, code)
+                depth = 1 + max(inlined[obj_id][1] for obj_id in inlined_ids)
+
+            cur_uses = uses.get(cur_obj.obj_id, [])
+            if len(cur_uses) == 1 and depth < _max_fusion_depth:
+                user, position = cur_uses[0]
+                if user is not self and cur_obj.obj_id in user.dependencies and "|" not in user.weld_code[:position]:
+                    inlined[cur_obj.obj_id] = ("(%s)" % code, depth)
+                    continue
+
+            let_statements.append("let %s = (%s);" % (cur_obj.obj_id, code))
+        let_statements.append(self.obj_id)
+
+        self._let_cache = "\n".join(let_statements)
+
+        return self._let_cache
 
     def to_weld_func(self):
-        names = sorted(self.context.keys())
-        arg_strs = ["{0}: {1}".format(str(name),
-                                      str(self.encoder.py_to_weld_type(self.context[name])))
-                    for name in names]
-        header = "|" + ", ".join(arg_strs) + "|"
+        names = self._input_names()
+        header = "|" + ", ".join("%s: %s" % (name, self._input_type(name)[2]) for name in names) + "|"
         text = header + " " + self.get_let_statements() + "\n" + self.weld_code
 
         return text
@@ -145,20 +598,21 @@ class WeldObject(object):
 
     def evaluate(self, restype, verbose=True, decode=True, passes=None,
                  num_threads=1, apply_experimental_transforms=False):
-        func = self.to_weld_func()
-
-        # Returns a wrapped ctypes Structure
-        def args_factory(encoded_fields):
-            class Args(ctypes.Structure):
-                _fields_ = [e for e in encoded_fields]
+        # A program merely returning one of its inputs does not need to go through Weld
+        if decode and len(self.dependencies) == 0:
+            name = self.weld_code.strip()
+            if name in self.context and name not in self.argtypes and self._input_type(name)[0] == restype:
+                return self.context[name]
 
-            return Args
+        func = self.to_weld_func()
+        # only time the steps if they're printed
+        clock = time.perf_counter if verbose else _no_clock
 
         # Encode each input argument. This is the positional argument list
         # which will be wrapped into a Weld struct and passed to the Weld API.
-        names = sorted(self.context.keys())
+        names = self._input_names()
 
-        start = time.time()
+        start = clock()
         encoded = []
         argtypes = []
         for name in names:
@@ -166,67 +620,59 @@ class WeldObject(object):
                 argtypes.append(self.argtypes[name].ctype_class)
                 encoded.append(self.context[name])
             else:
-                argtypes.append(self.encoder.py_to_weld_type(
-                    self.context[name]).ctype_class)
+                argtypes.append(self._input_type(name)[1])
                 encoded.append(self.encoder.encode(self.context[name]))
-        end = time.time()
+        end = clock()
 
         if verbose:
             print("Python->Weld:", end - start)
 
-        args = args_factory(zip(names, argtypes))
-        weld_args = args()
-        for name, value in zip(names, encoded):
-            setattr(weld_args, name, value)
+        args = WeldObject._args_factory(tuple(argtypes))
+        # the fields are filled in by position, which also type checks them and keeps the values alive
+        weld_args = args(*encoded)
 
-        start = time.time()
-        void_ptr = ctypes.cast(ctypes.byref(weld_args), ctypes.c_void_p)
-        arg = cweld.WeldValue(void_ptr)
-        conf = cweld.WeldConf()
-        err = cweld.WeldError()
+        start = clock()
+        # weld_value_new takes a c_void_p, which ctypes converts from the plain address
+        arg = cweld.WeldValue(ctypes.addressof(weld_args))
 
         if passes is not None:
-            passes = ",".join(passes)
-            passes = passes.strip()
-            if passes != "":
-                conf.set("weld.optimization.passes", passes)
+            passes = ",".join(passes).strip()
+        else:
+            passes = ""
 
-        module = cweld.WeldModule(func, conf, err)
-        if err.code() != 0:
-            raise ValueError("Could not compile function {}: {}".format(
-                func, err.message()))
-        end = time.time()
+        module = WeldObject._compile(func, passes, apply_experimental_transforms)
+        end = clock()
 
         if verbose:
             print("Weld compile time:", end - start)
 
-        start = time.time()
-        conf = cweld.WeldConf()
-        conf.set("weld.threads", str(num_threads))
-        conf.set("weld.memory.limit", "100000000000")
-        conf.set("weld.optimization.applyExperimentalTransforms",
-                 "true" if apply_experimental_transforms else "false")
-        err = cweld.WeldError()
+        start = clock()
+        conf = WeldObject._conf(("weld.threads", str(num_threads)),
+                                ("weld.memory.limit", "100000000000"),
+                                ("weld.optimization.applyExperimentalTransforms",
+                                 "true" if apply_experimental_transforms else "false"))
+        err = WeldObject._error()
         weld_ret = module.run(conf, arg, err)
         if err.code() != 0:
+            WeldObject._thread_local.error = None
             raise ValueError(("Error while running function,\n{}\n\n"
                               "Error message: {}").format(
                 func, err.message()))
         ptrtype = POINTER(restype.ctype_class)
         data = ctypes.cast(weld_ret.data(), ptrtype)
-        end = time.time()
+        end = clock()
 
         if verbose:
             print("Weld:", end - start)
 
-        start = time.time()
+        start = clock()
         if decode:
             result = self.decoder.decode(data, restype)
         else:
             data = cweld.WeldValue(weld_ret).data()
             result = ctypes.cast(data, ctypes.POINTER(
                 ctypes.c_int64)).contents.value
-        end = time.time()
+        end = clock()
 
         if verbose:
             print("Weld->Python:", end - start)
@@ -1,3 +1,5 @@
+import ctypes
+
 import numpy as np
 import pytest
 
@@ -30,6 +32,52 @@ class TestNumPyEncoders(object):
 
         np.testing.assert_array_equal(evaluated, expected)
 
+    @pytest.mark.parametrize('data', [
+        np.array([1, 2, 3], dtype=np.int16),
+        np.array([1, 2, 3], dtype=np.int64),
+        np.array([1, 2, 3], dtype=np.float64),
+        np.array([True, True, False], dtype=np.bool)
+    ])
+    def test_encode_zero_copy(self, data):
+        encoded = self._encoder.encode(data)
+
+        assert ctypes.cast(encoded.ptr, ctypes.c_void_p).value == data.ctypes.data
+        assert encoded.size == len(data)
+
+    def test_encode_non_native_byte_order(self):
+        with pytest.raises(TypeError):
+            self._encoder.encode(np.arange(3, dtype='>i8'))
+
+    def test_encode_cached(self):
+        data = np.array([1, 2, 3], dtype=np.int64)
+
+        assert self._encoder.encode(data) is self._encoder.encode(data)
+        assert self._encoder.encode(data) is not self._encoder.encode(data.copy())
+
+        encoded = self._encoder.encode(data)
+        data.dtype = np.float64
+
+        assert self._encoder.encode(data) is not encoded
+
+    def test_encode_0d(self):
+        with pytest.raises(ValueError):
+            self._encoder.encode(np.array(1, dtype=np.int64))
+
+    def test_encode_copied_not_cached(self):
+        # the convertor library copies the data of Fortran-ordered 2-d arrays
+        data = np.asfortranarray(np.array([[1, 2, 3], [4, 5, 6]], dtype=np.int64))
+        weld_obj = WeldObject(self._encoder, self._decoder)
+        obj_id = weld_obj.update(data)
+        weld_obj.weld_code = 'result(for({}, merger[i64, +], |b, i, e| ' \
+                             'merge(b, result(for(e, merger[i64, +], |b2, j, f| merge(b2, f))))))'.format(obj_id)
+        lazy_result = LazyResult(weld_obj, WeldLong(), 0)
+
+        assert lazy_result.evaluate() == 21
+
+        data[0, 0] = 11
+
+        assert lazy_result.evaluate() == 31
+
     @pytest.mark.parametrize('data, weld_type', [
         (np.array([1, np.nan, 3], dtype=np.float32), WeldFloat()),
         (np.array([1, np.nan, 3], dtype=np.float64), WeldDouble())
@@ -0,0 +1,236 @@
+import copy
+import gc
+import re
+
+import numpy as np
+
+from baloo.weld import LazyArrayResult, WeldLong, WeldObject
+from baloo.weld.pyweld.weldobject import _canonical_weld_code
+from baloo.weld.weld_utils import create_weld_object, create_placeholder_weld_object, get_weld_obj_id, \
+    _encoder, _decoder
+
+
+def _increment(data):
+    obj_id, weld_obj = create_weld_object(data)
+    weld_obj.weld_code = 'result(for({}, appender, |b, i, e| merge(b, e + 1L)))'.format(obj_id)
+
+    return LazyArrayResult(weld_obj, WeldLong())
+
+
+class TestWeldObject(object):
+    def test_update_same_input(self):
+        data = np.arange(5)
+        weld_obj = WeldObject(_encoder, _decoder)
+
+        assert weld_obj.update(data) == weld_obj.update(data)
+        assert weld_obj.update(np.arange(5)) != weld_obj.update(data)
+        assert weld_obj.update('abc') == weld_obj.update('abc')
+
+    def test_update_registry_eviction(self):
+        data = np.arange(5)
+        key = id(data)
+        WeldObject(_encoder, _decoder).update(data)
+
+        assert key in WeldObject._registry
+
+        del data
+        gc.collect()
+
+        assert key not in WeldObject._registry
+
+    def test_input_type_reassigned_dtype(self):
+        data = np.arange(6)
+        weld_obj = WeldObject(_encoder, _decoder)
+        name = weld_obj.update(data)
+
+        assert str(weld_obj._input_type(name)[0]) == 'vec[i64]'
+
+        data.shape = (2, 3)
+
+        assert str(weld_obj._input_type(name)[0]) == 'vec[vec[i64]]'
+
+        data.dtype = np.float64
+
+        assert str(weld_obj._input_type(name)[0]) == 'vec[vec[f64]]'
+
+    def test_canonical_weld_code(self):
+        actual = _canonical_weld_code('|_inp12: vec[i64]| let obj105 = (len(_inp12));\nobj105\nlen(_inp12)')
+        expected = '|_inp0: vec[i64]| let obj1 = (len(_inp0));\nobj1\nlen(_inp0)'
+
+        assert actual == expected
+
+    def test_module_cache(self):
+        WeldObject._module_cache.clear()
+
+        actual1 = _increment(np.arange(5)).evaluate()
+        actual2 = _increment(np.arange(5, 10)).evaluate()
+
+        assert len(WeldObject._module_cache) == 1
+        np.testing.assert_array_equal(actual1, np.arange(1, 6))
+        np.testing.assert_array_equal(actual2, np.arange(6, 11))
+
+    def test_module_cache_bounded(self, monkeypatch):
+        monkeypatch.setattr(WeldObject, '_module_cache_size', 1)
+        WeldObject._module_cache.clear()
+
+        _increment(np.arange(5)).evaluate()
+        # another literal, hence another program
+        obj_id, weld_obj = create_weld_object(np.arange(5))
+        weld_obj.weld_code = 'result(for({}, appender, |b, i, e| merge(b, e + 2L)))'.format(obj_id)
+        actual = LazyArrayResult(weld_obj, WeldLong()).evaluate()
+
+        assert len(WeldObject._module_cache) == 1
+        np.testing.assert_array_equal(actual, np.arange(2, 7))
+
+    def test_module_cache_disabled(self, monkeypatch):
+        monkeypatch.setenv('BALOO_DISABLE_MODULE_CACHE', '1')
+        WeldObject._module_cache.clear()
+
+        actual = _increment(np.arange(5)).evaluate()
+
+        assert len(WeldObject._module_cache) == 0
+        np.testing.assert_array_equal(actual, np.arange(1, 6))
+
+    def test_let_statements_reset(self):
+        obj_id, weld_obj = create_weld_object(np.arange(5))
+        weld_obj.weld_code = 'len({})'.format(obj_id)
+        weld_obj.get_let_statements()
+        weld_obj.weld_code = '{}'.format(obj_id)
+
+        actual = weld_obj.get_let_statements()
+        expected = 'let {0} = ({1});\n{0}'.format(weld_obj.obj_id, obj_id)
+
+        assert actual == expected
+
+    def test_let_statements_reset_on_dependency(self):
+        obj_id, weld_obj1 = create_weld_object(np.arange(5))
+        weld_obj1.weld_code = 'len({})'.format(obj_id)
+        weld_obj2 = WeldObject(_encoder, _decoder)
+        weld_obj2.weld_code = '{0} + {0}'.format(weld_obj1.obj_id)
+        weld_obj2.get_let_statements()
+        # added in-place, as done throughout the library
+        weld_obj2.dependencies[weld_obj1.obj_id] = weld_obj1
+
+        assert 'let {} = (len('.format(weld_obj1.obj_id) in weld_obj2.get_let_statements()
+
+        weld_obj1.weld_code = 'len({}) * 2L'.format(obj_id)
+
+        assert 'let {} = (len({}) * 2L);'.format(weld_obj1.obj_id, obj_id) in weld_obj2.get_let_statements()
+
+    def test_dependencies_copy(self):
+        obj_id, weld_obj1 = create_weld_object(np.arange(5))
+        weld_obj1.weld_code = 'len({})'.format(obj_id)
+        weld_obj2 = create_placeholder_weld_object(weld_obj1)
+        expected = weld_obj2.get_let_statements()
+
+        assert list(weld_obj2.dependencies.copy()) == [weld_obj1.obj_id]
+        assert list(copy.deepcopy(weld_obj2.dependencies)) == [weld_obj1.obj_id]
+
+        weld_obj3 = copy.copy(weld_obj2)
+        weld_obj4 = WeldObject(_encoder, _decoder)
+        weld_obj4.weld_code = '1L'
+        weld_obj3.dependencies[weld_obj4.obj_id] = weld_obj4
+        weld_obj3.weld_code = '{} + {}'.format(weld_obj1.obj_id, weld_obj4.obj_id)
+
+        assert weld_obj2.get_let_statements() == expected
+        assert 'let {} = (1L);'.format(weld_obj4.obj_id) in weld_obj3.get_let_statements()
+
+    def test_let_statements_order(self):
+        # enough objects for their ids to no longer sort lexicographically
+        weld_obj = create_placeholder_weld_object(np.arange(5))
+        for _ in range(1000):
+            obj_id, weld_obj = create_weld_object(weld_obj)
+            # used twice so it is not fused
+            weld_obj.weld_code = '{0} + {0}'.format(obj_id)
+
+        lines = weld_obj.get_let_statements().split('\n')
+        defined = {line.split(' ')[1]: i for i, line in enumerate(lines[:-1])}
+        used = [re.findall(r'obj\d+', line.split('=', 1)[1]) for line in lines[:-1]]
+
+        assert len(defined) == 1001
+        assert all(defined[obj_id] < i for i, obj_ids in enumerate(used) for obj_id in obj_ids)
+        assert lines[-1] == weld_obj.obj_id
+
+    def test_let_statements_fusion(self):
+        obj_id1, weld_obj1 = create_weld_object(np.arange(5))
+        weld_obj1.weld_code = 'len({})'.format(obj_id1)
+        obj_id2, weld_obj2 = create_weld_object(weld_obj1)
+        weld_obj2.weld_code = '{} + 1L'.format(obj_id2)
+        obj_id3, weld_obj3 = create_weld_object(weld_obj2)
+        weld_obj3.weld_code = '{} * 2L'.format(obj_id3)
+
+        actual = weld_obj3.get_let_statements()
+        expected = 'let {1} = ((len({0})) + 1L);\nlet {2} = ({1} * 2L);\n{2}'.format(obj_id1,
+                                                                                   weld_obj2.obj_id,
+                                                                                   weld_obj3.obj_id)
+
+        assert actual == expected
+
+    def test_let_statements_no_fusion_in_lambda(self):
+        data = np.arange(5)
+        weld_obj1 = create_placeholder_weld_object(data)
+        weld_obj1.weld_code = 'len({})'.format(weld_obj1.weld_code)
+        obj_id, weld_obj2 = create_weld_object(data)
+        length_id = get_weld_obj_id(weld_obj2, weld_obj1)
+        weld_obj2.weld_code = 'result(for({}, appender, |b, i, e| merge(b, e + {})))'.format(obj_id, length_id)
+        weld_obj3 = create_placeholder_weld_object(weld_obj2)
+
+        actual = weld_obj3.get_let_statements()
+
+        assert 'let {} = '.format(weld_obj1.obj_id) in actual
+        np.testing.assert_array_equal(LazyArrayResult(weld_obj3, WeldLong()).evaluate(), np.arange(5, 10))
+
+    def test_persisted_module_cache(self, monkeypatch, tmpdir):
+        monkeypatch.setenv('BALOO_PERSIST_MODULE_CACHE', '1')
+        monkeypatch.setenv('BALOO_MODULE_CACHE_DIR', str(tmpdir))
+        WeldObject._module_cache.clear()
+
+        _increment(np.arange(5)).evaluate()
+
+        assert len(tmpdir.listdir()) == 1
+
+        WeldObject._module_cache.clear()
+
+        assert WeldObject.warm_module_cache() == 1
+        assert len(WeldObject._module_cache) == 1
+
+    def test_warm_module_cache_invalid(self, monkeypatch, tmpdir):
+        monkeypatch.setenv('BALOO_MODULE_CACHE_DIR', str(tmpdir))
+        for i, text in enumerate(['[]', '{}', '"code"', '{"weld": 1', '{"weld": "", "code": 1}']):
+            tmpdir.join('{}.json'.format(i)).write(text)
+
+        assert WeldObject.warm_module_cache() == 0
+        assert len(tmpdir.listdir()) == 0
+
+    def test_persisted_module_cache_bounded(self, monkeypatch, tmpdir):
+        monkeypatch.setenv('BALOO_PERSIST_MODULE_CACHE', '1')
+        monkeypatch.setenv('BALOO_MODULE_CACHE_DIR', str(tmpdir))
+        monkeypatch.setattr(WeldObject, '_module_cache_size', 2)
+        WeldObject._module_cache.clear()
+
+        for i in range(3):
+            obj_id, weld_obj = create_weld_object(np.arange(5))
+            weld_obj.weld_code = 'result(for({}, appender, |b, i, e| merge(b, e + {}L)))'.format(obj_id, i)
+            LazyArrayResult(weld_obj, WeldLong()).evaluate()
+
+        assert len(tmpdir.listdir()) == 2
+
+        WeldObject._module_cache.clear()
+        monkeypatch.setattr(WeldObject, '_module_cache_size', 1)
+
+        assert WeldObject.warm_module_cache() == 1
+
+        monkeypatch.setenv('BALOO_DISABLE_MODULE_CACHE', '1')
+        WeldObject._module_cache.clear()
+
+        assert WeldObject.warm_module_cache() == 0
+
+    def test_evaluate_identity(self):
+        data = np.arange(5)
+        weld_obj = create_placeholder_weld_object(data)
+        WeldObject._module_cache.clear()
+
+        actual = LazyArrayResult(weld_obj, WeldLong()).evaluate()
+
+        assert actual is data
+        assert len(WeldObject._module_cache) == 0